@@ -16,8 +16,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def download_all_fonts():
-    """下载所有BabelDOC字体"""
+FONT_CACHE_DIR = os.path.expanduser("~/.cache/babeldoc/fonts")
+
+def list_cached_fonts():
+    """读取一次字体缓存目录，返回已存在的文件名集合"""
+    if not os.path.isdir(FONT_CACHE_DIR):
+        return set()
+    with os.scandir(FONT_CACHE_DIR) as it:
+        return {e.name for e in it if e.is_file()}
+
+async def download_all_fonts(force=False):
+    """下载所有BabelDOC字体，force为True时不跳过缓存中已存在的字体"""
     try:
         from babeldoc.assets import assets
 
@@ -90,35 +99,30 @@ async def download_all_fonts():
                 "GoNotoKurrent-Bold.ttf",
             ]
 
-            # 分批下载避免并发过高
-            batch_size = 5
-            total_batches = (len(key_fonts) + batch_size - 1) // batch_size
-
-            for batch_idx in range(total_batches):
-                start_idx = batch_idx * batch_size
-                end_idx = min(start_idx + batch_size, len(key_fonts))
-                batch = key_fonts[start_idx:end_idx]
-
-                logger.info(f"  下载批次 {batch_idx + 1}/{total_batches} ({len(batch)} 个字体)")
-                tasks = []
-                for font in batch:
-                    async def download_font(font_name):
-                        try:
-                            font_path, font_metadata = await assets.get_font_and_metadata_async(font_name)
-                            return font_name, font_path is not None, None
-                        except Exception as e:
-                            return font_name, False, str(e)
-
-                    tasks.append(download_font(font))
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in results:
-                    font_name, success, error = result if not isinstance(result, Exception) else (None, False, str(result))
-                    if font_name:
-                        if success:
-                            logger.info(f"    ✅ {font_name} 下载成功")
-                        else:
-                            logger.warning(f"    ⚠️  {font_name} 下载失败: {error}")
+            # 跳过缓存中已存在的字体，避免不必要的网络请求（强制重新下载时不跳过）
+            existing = set() if force else list_cached_fonts()
+            todo = [f for f in key_fonts if f not in existing]
+            logger.info(f"  已缓存 {len(key_fonts) - len(todo)} 个字体，跳过下载")
+
+            # 用信号量限制并发，任一下载完成即可开始下一个，避免批次间互相等待
+            sem = asyncio.Semaphore(5)
+
+            async def download_font(font_name):
+                async with sem:
+                    try:
+                        font_path, font_metadata = await assets.get_font_and_metadata_async(font_name)
+                        return font_name, font_path is not None, None
+                    except Exception as e:
+                        return font_name, False, str(e)
+
+            logger.info(f"  并发下载 {len(todo)} 个字体 (并发数: 5)")
+            tasks = [asyncio.create_task(download_font(font)) for font in todo]
+            for coro in asyncio.as_completed(tasks):
+                font_name, success, error = await coro
+                if success:
+                    logger.info(f"    ✅ {font_name} 下载成功")
+                else:
+                    logger.warning(f"    ⚠️  {font_name} 下载失败: {error}")
 
             logger.info(f"✅ 方法3完成：关键字体下载完成，共 {len(key_fonts)} 个字体")
             return True
@@ -133,7 +137,7 @@ async def download_all_fonts():
 def check_font_cache():
     """检查字体缓存"""
     try:
-        font_cache_dir = os.path.expanduser("~/.cache/babeldoc/fonts")
+        font_cache_dir = FONT_CACHE_DIR
 
         logger.info(f"=== 检查字体缓存目录 ===")
         logger.info(f"路径: {font_cache_dir}")
@@ -142,14 +146,14 @@ def check_font_cache():
             logger.warning("⚠️  字体缓存目录不存在")
             return False
 
-        font_files = [f for f in os.listdir(font_cache_dir) if f.endswith('.ttf')]
+        # 一次scandir遍历同时拿到文件名和大小，避免逐个stat
+        with os.scandir(font_cache_dir) as it:
+            font_files = [(e.name, e.stat().st_size) for e in it if e.is_file() and e.name.endswith('.ttf')]
         logger.info(f"✅ 找到 {len(font_files)} 个字体文件")
 
         if len(font_files) > 0:
             logger.info("字体文件列表:")
-            for f in font_files[:10]:  # 只显示前10个
-                font_path = os.path.join(font_cache_dir, f)
-                size = os.path.getsize(font_path) if os.path.exists(font_path) else 0
+            for f, size in font_files[:10]:  # 只显示前10个
                 logger.info(f"  - {f} ({size / 1024 / 1024:.2f} MB)")
 
             if len(font_files) > 10:
@@ -170,8 +174,15 @@ async def main():
     logger.info("🚀 BabelDOC字体预下载工具启动")
     logger.info("=" * 60)
 
+    # 缓存已满足要求时直接退出，不发起任何网络请求（FORCE_FONT_REDOWNLOAD=1 强制重新下载）
+    force = os.getenv("FORCE_FONT_REDOWNLOAD", "0") == "1"
+    if not force and check_font_cache():
+        logger.info("=" * 60)
+        logger.info("✅ 字体缓存已就绪，跳过下载")
+        return 0
+
     # 下载字体
-    success = await download_all_fonts()
+    success = await download_all_fonts(force)
 
     # 检查缓存
     cache_ok = check_font_cache()
@@ -11,7 +11,7 @@ from pathlib import Path
 # 添加src目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from pdftranslate_web.gradio_client import main
-
 if __name__ == "__main__":
+    # 预览渲染进程池的spawn子进程会重新执行本脚本（非__main__），导入放在这里以免子进程加载gradio
+    from pdftranslate_web.gradio_client import main
     main()
\ No newline at end of file
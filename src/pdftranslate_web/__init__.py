@@ -10,9 +10,23 @@ BabelDOC PDF Translation Package
 __version__ = "0.0.1"
 __author__ = "wwwzhouhui"
 
-from .api_server import app, start_server
-from .api_client import BabelDOCClient
-from .gradio_client import create_gradio_interface, GradioClient
+import importlib
+
+# 子模块按需导入：进程池的spawn子进程会导入本包，不应因此加载gradio或BabelDOC
+_LAZY_ATTRS = {
+    "app": "api_server",
+    "start_server": "api_server",
+    "BabelDOCClient": "api_client",
+    "create_gradio_interface": "gradio_client",
+    "GradioClient": "gradio_client",
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "app",
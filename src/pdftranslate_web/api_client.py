@@ -1,13 +1,27 @@
-import requests
+import asyncio
+import base64
+import httpx
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List
 import json
 
+# 连接池上限：并发下载与多个Gradio会话共用同一客户端
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=4)
+
+# 服务器不支持状态推送时的轮询间隔（秒）
+STATUS_POLL_INTERVAL = 5
+
 class BabelDOCClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        # 复用keep-alive连接池，避免每次请求重新建立连接
+        self.session = httpx.Client(
+            base_url=self.base_url,
+            timeout=30,
+            limits=HTTP_LIMITS
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
     
     def translate_pdf(
         self,
@@ -57,7 +71,7 @@ class BabelDOCClient:
         
         try:
             response = self.session.post(
-                f"{self.base_url}/translate",
+                "/translate",
                 files=files,
                 data=data
             )
@@ -77,10 +91,50 @@ class BabelDOCClient:
         Returns:
             任务状态信息
         """
-        response = self.session.get(f"{self.base_url}/status/{task_id}")
+        response = self.session.get(f"/status/{task_id}")
         response.raise_for_status()
         return response.json()
     
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(base_url=self.base_url, limits=HTTP_LIMITS)
+        return self._async_client
+    
+    async def stream_status(self, task_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        订阅服务器推送的任务状态 (Server-Sent Events)，任务结束后迭代终止。
+        旧版本服务器没有 /stream 接口时退回到每 STATUS_POLL_INTERVAL 秒轮询一次 /status
+        
+        Args:
+            task_id: 任务ID
+        
+        Yields:
+            每次状态变化时的任务状态信息
+        """
+        # 服务器无变化时每15秒发送一次心跳，读超时留出余量即可
+        async with self._get_async_client().stream(
+            "GET", f"/stream/{task_id}", timeout=httpx.Timeout(30, read=60)
+        ) as response:
+            # 任务不存在时下面的 /status 轮询同样会返回404并抛出异常
+            if response.status_code != 404:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        yield json.loads(line[5:])
+                return
+        
+        last = None
+        while True:
+            response = await self._get_async_client().get(f"/status/{task_id}")
+            response.raise_for_status()
+            status = response.json()
+            if status != last:
+                last = status
+                yield status
+            if status['status'] in ('completed', 'failed'):
+                return
+            await asyncio.sleep(STATUS_POLL_INTERVAL)
+    
     def wait_for_completion(self, task_id: str, check_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
         """
         等待翻译任务完成
@@ -118,7 +172,7 @@ class BabelDOCClient:
         Returns:
             下载是否成功
         """
-        response = self.session.get(f"{self.base_url}/download/{task_id}/{file_type}")
+        response = self.session.get(f"/download/{task_id}/{file_type}")
         
         if response.status_code == 404:
             return False
@@ -130,6 +184,23 @@ class BabelDOCClient:
         
         return True
     
+    def get_thumbnails(self, task_id: str, file_type: str) -> List[bytes]:
+        """
+        获取翻译结果每一页的JPEG缩略图
+        
+        Args:
+            task_id: 任务ID
+            file_type: 文件类型 ("dual" 或 "mono")
+        
+        Returns:
+            按页码排列的JPEG数据列表，服务器未提供缩略图时为空
+        """
+        response = self.session.get(f"/thumbnails/{task_id}/{file_type}")
+        if response.status_code == 404:
+            return []
+        response.raise_for_status()
+        return [base64.b64decode(t) for t in response.json()['thumbnails']]
+    
     def translate_and_download(
         self,
         pdf_path: str,
@@ -199,9 +270,9 @@ class BabelDOCClient:
             服务是否健康
         """
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = self.session.get("/health")
             return response.status_code == 200
-        except requests.RequestException:
+        except httpx.HTTPError:
             return False
     
     def get_server_config(self) -> Dict[str, Any]:
@@ -211,7 +282,7 @@ class BabelDOCClient:
         Returns:
             服务器配置信息
         """
-        response = self.session.get(f"{self.base_url}/")
+        response = self.session.get("/")
         response.raise_for_status()
         return response.json()
 
@@ -1,20 +1,34 @@
 import asyncio
+import base64
+import functools
+import io
+import json
 import logging
+import multiprocessing
+import queue
+import time
 import uuid
+from types import MappingProxyType
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import tempfile
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.managers import SyncManager
 import os
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 from dotenv import load_dotenv
 
 import babeldoc.format.pdf.high_level
+from babeldoc.docvision.doclayout import DocLayoutModel
 from babeldoc.format.pdf.translation_config import TranslationConfig, WatermarkOutputMode
 from babeldoc.translator.translator import OpenAITranslator, set_translate_rate_limiter
 
@@ -50,7 +64,22 @@ if not config["openai"]["api_key"]:
     logger.error("未找到OpenAI API密钥！请通过环境变量OPENAI_API_KEY提供")
     raise ValueError("Missing OpenAI API key")
 
-app = FastAPI(title="BabelDOC Translation API", version="0.4.16")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """启动时完成初始化和预热，把冷启动开销从首个翻译请求转移到服务启动阶段"""
+    # 翻译只在工作进程中执行，BabelDOC由各工作进程在_init_worker中初始化；
+    # 预先启动工作进程，进程初始化时会加载版面分析模型，避免首个翻译任务等待
+    await asyncio.get_running_loop().run_in_executor(_get_executor(), _ping_worker)
+    _get_mp_manager()
+    # 启动过期任务清理
+    await start_janitor()
+    logger.info("Translation pipeline warmed up")
+    yield
+    if _janitor_task is not None:
+        _janitor_task.cancel()
+    _shutdown_executor()
+
+app = FastAPI(title="BabelDOC Translation API", version="0.4.16", lifespan=lifespan)
 
 class TranslationRequest(BaseModel):
     lang_in: Optional[str] = None
@@ -60,15 +89,285 @@ class TranslationRequest(BaseModel):
     no_mono: Optional[bool] = None
     watermark_output_mode: Optional[str] = None
 
-class TranslationStatus(BaseModel):
+@dataclass(slots=True)
+class TranslationStatus:
+    """任务状态的内部存储，进度循环中的字段写入是直接的slot赋值"""
     task_id: str
     status: str  # pending, processing, completed, failed
     progress: float = 0.0
     message: str = ""
+    result_files: Dict[str, str] = field(default_factory=dict)
+
+class TranslationStatusOut(BaseModel):
+    task_id: str
+    status: str
+    progress: float = 0.0
+    message: str = ""
     result_files: Dict[str, str] = {}
 
-translation_tasks: Dict[str, TranslationStatus] = {}
+# 任务记录数量上限与过期时间，避免长时间运行的服务内存和临时文件无限增长
+MAX_TASKS = int(os.getenv("MAX_TASKS", "512"))
+TASK_TTL_SECS = int(os.getenv("TASK_TTL_SECS", "86400"))
+JANITOR_INTERVAL_SECS = 600
+
+# 按最近访问顺序排列，便于按LRU淘汰
+translation_tasks: "OrderedDict[str, TranslationStatus]" = OrderedDict()
 task_files: Dict[str, Dict[str, Path]] = {}
+# 缩略图在首次请求时按文件类型生成，{任务ID: {文件类型: 生成任务}}，并发请求共用同一个生成任务
+task_thumbnails: Dict[str, Dict[str, "asyncio.Task[List[Path]]"]] = {}
+task_dirs: Dict[str, Path] = {}
+task_finished_at: Dict[str, float] = {}
+_janitor_task: Optional[asyncio.Task] = None
+
+def _remove_task(task_id: str) -> Optional[Path]:
+    """移除任务记录，返回需要清理的临时目录"""
+    translation_tasks.pop(task_id, None)
+    task_files.pop(task_id, None)
+    task_thumbnails.pop(task_id, None)
+    task_finished_at.pop(task_id, None)
+    return task_dirs.pop(task_id, None)
+
+async def _purge_tasks(task_ids: List[str]):
+    """移除任务记录并在线程中删除其临时目录"""
+    for task_id in task_ids:
+        temp_dir = _remove_task(task_id)
+        if temp_dir is not None:
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+    if task_ids:
+        logger.info(f"Purged {len(task_ids)} finished tasks")
+
+async def _evict_lru_tasks():
+    """任务数超过上限时，按LRU顺序淘汰已结束的任务（进行中的任务不淘汰）"""
+    excess = len(translation_tasks) - MAX_TASKS
+    if excess <= 0:
+        return
+    evicted = [task_id for task_id in translation_tasks if task_id in task_finished_at][:excess]
+    await _purge_tasks(evicted)
+
+async def _janitor():
+    """定期清理结束时间超过TASK_TTL_SECS的任务"""
+    while True:
+        await asyncio.sleep(JANITOR_INTERVAL_SECS)
+        now = time.monotonic()
+        expired = [task_id for task_id, finished in task_finished_at.items() if now - finished > TASK_TTL_SECS]
+        await _purge_tasks(expired)
+
+async def start_janitor():
+    global _janitor_task
+    if _janitor_task is None:
+        _janitor_task = asyncio.create_task(_janitor())
+
+# 限制同时进行的翻译任务数量，超出的任务保持pending直到获得名额
+TRANSLATION_SEM = asyncio.BoundedSemaphore(int(os.getenv("MAX_CONCURRENT_TRANSLATIONS", "2")))
+
+# 翻译中的CPU密集部分（ONNX推理、PDF渲染、字体子集化）放到独立进程执行，避免与事件循环争抢GIL
+TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+_executor: Optional[ProcessPoolExecutor] = None
+_mp_manager: Optional[SyncManager] = None
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 使用spawn避免在已有线程的进程中fork
+        _executor = ProcessPoolExecutor(
+            max_workers=TRANSLATION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _executor
+
+def _discard_executor(executor: ProcessPoolExecutor):
+    """工作进程异常退出（OOM、MuPDF/ONNX崩溃）后进程池不可再用，丢弃它，下一个任务会重新创建"""
+    global _executor
+    if _executor is executor:
+        _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _get_mp_manager() -> SyncManager:
+    global _mp_manager
+    if _mp_manager is None:
+        _mp_manager = multiprocessing.get_context("spawn").Manager()
+    return _mp_manager
+
+def _shutdown_executor():
+    global _executor, _mp_manager
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    if _mp_manager is not None:
+        _mp_manager.shutdown()
+        _mp_manager = None
+
+def _init_worker():
+    """工作进程初始化：加载BabelDOC并预热版面分析模型"""
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel("WARNING")
+    logging.getLogger("openai").setLevel("WARNING")
+    babeldoc.format.pdf.high_level.init()
+    _get_doc_layout_model()
+
+def _ping_worker() -> bool:
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _get_doc_layout_model() -> DocLayoutModel:
+    """版面分析模型在每个工作进程中只加载一次，进程内所有翻译任务共享"""
+    return DocLayoutModel.load_onnx()
+
+WATERMARK_MODES = MappingProxyType({
+    "no_watermark": WatermarkOutputMode.NoWatermark,
+    "both": WatermarkOutputMode.Both,
+    "watermarked": WatermarkOutputMode.Watermarked,
+})
+
+# TranslationConfig中不随请求变化的参数
+_TC_DEFAULTS = MappingProxyType(dict(
+    font=None,
+    pages=None,
+    debug=False,
+    formular_font_pattern=None,
+    formular_char_pattern=None,
+    split_short_lines=False,
+    short_line_split_factor=0.8,
+    skip_clean=False,
+    dual_translate_first=False,
+    disable_rich_text_translate=False,
+    enhance_compatibility=False,
+    use_alternating_pages_dual=False,
+    report_interval=0.1,
+    min_text_length=5,
+    split_strategy=None,
+    table_model=None,
+    show_char_box=False,
+    skip_scanned_detection=False,
+    ocr_workaround=False,
+    custom_system_prompt=None,
+    working_dir=None,
+    add_formula_placehold_hint=False,
+    pool_max_workers=None,
+    auto_extract_glossary=True,
+    auto_enable_ocr_workaround=False,
+    primary_font_family=None,
+    only_include_translated_page=False,
+    save_auto_extracted_glossary=False,
+))
+
+@functools.lru_cache(maxsize=16)
+def _get_translator(lang_in: str, lang_out: str) -> OpenAITranslator:
+    """按语言对复用翻译器，使各任务共享同一个HTTP连接池"""
+    # 使用配置文件中的OpenAI设置
+    return OpenAITranslator(
+        lang_in=lang_in,
+        lang_out=lang_out,
+        model=config["openai"]["model"],
+        base_url=config["openai"]["base_url"],
+        api_key=config["openai"]["api_key"],
+        ignore_cache=False,
+    )
+
+def _build_translation_config(pdf_file: str, request: TranslationRequest, output_dir: str) -> TranslationConfig:
+    translator = _get_translator(
+        request.lang_in or config["translation"]["default_lang_in"],
+        request.lang_out or config["translation"]["default_lang_out"],
+    )
+
+    # 限流器在每个工作进程中各自生效，同时进行的任务对服务商的总请求频率为 QPS × 并发任务数
+    set_translate_rate_limiter(request.qps or config["server"]["qps"])
+
+    doc_layout_model = _get_doc_layout_model()
+
+    watermark_output_mode = request.watermark_output_mode or config["translation"]["watermark_output_mode"]
+    watermark_mode = WATERMARK_MODES.get(watermark_output_mode, WatermarkOutputMode.Watermarked)
+
+    return TranslationConfig(
+        input_file=pdf_file,
+        output_dir=output_dir,
+        translator=translator,
+        lang_in=request.lang_in or config["translation"]["default_lang_in"],
+        lang_out=request.lang_out or config["translation"]["default_lang_out"],
+        no_dual=request.no_dual if request.no_dual is not None else config["translation"]["no_dual"],
+        no_mono=request.no_mono if request.no_mono is not None else config["translation"]["no_mono"],
+        qps=request.qps or config["server"]["qps"],
+        doc_layout_model=doc_layout_model,
+        watermark_output_mode=watermark_mode,
+        # 列表是可变对象，每个任务单独创建
+        glossaries=[],
+        **_TC_DEFAULTS,
+    )
+
+# 结果PDF预览缩略图的缩放比例和JPEG质量
+THUMBNAIL_ZOOM = 0.5
+THUMBNAIL_JPEG_QUALITY = 70
+
+def _render_thumbnails(pdf_path: Path, thumb_dir: Path) -> List[Path]:
+    """为结果PDF逐页生成JPEG缩略图，客户端预览时无需再本地渲染"""
+    import fitz  # PyMuPDF
+
+    thumb_dir.mkdir(parents=True, exist_ok=True)
+    matrix = fitz.Matrix(THUMBNAIL_ZOOM, THUMBNAIL_ZOOM)
+    paths = []
+    with fitz.open(pdf_path) as doc:
+        for page_num, page in enumerate(doc):
+            thumb_path = thumb_dir / f"{page_num:04d}.jpg"
+            thumb_path.write_bytes(page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False).tobytes("jpeg", jpg_quality=THUMBNAIL_JPEG_QUALITY))
+            paths.append(thumb_path)
+    return paths
+
+PROGRESS_MIN_INTERVAL = 0.5
+PROGRESS_MESSAGE_TEMPLATE = "{stage} ({stage_current}/{stage_total})"
+
+async def _translate_in_worker(pdf_file: str, request: TranslationRequest, output_dir: str, events):
+    config_obj = _build_translation_config(pdf_file, request, output_dir)
+    events.put({"type": "started"})
+
+    last_emit = 0.0
+    async for event in babeldoc.format.pdf.high_level.async_translate(config_obj):
+        if event["type"] == "progress_update":
+            # 合并高频进度事件，最多每PROGRESS_MIN_INTERVAL秒回传一次（100%时总是回传）
+            now = time.monotonic()
+            if now - last_emit < PROGRESS_MIN_INTERVAL and event.get("overall_progress", 0.0) < 100:
+                continue
+            last_emit = now
+            events.put({
+                "type": "progress_update",
+                "overall_progress": event.get("overall_progress", 0.0),
+                "stage": event.get("stage", "处理中"),
+                "stage_current": event.get("stage_current", 0),
+                "stage_total": event.get("stage_total", 100),
+            })
+        elif event["type"] == "error":
+            events.put({"type": "error", "error": str(event.get("error", "未知错误"))})
+            return
+        elif event["type"] == "finish":
+            result = event["translate_result"]
+            # 只回传结果路径，TranslateResult对象不保证可以跨进程序列化
+            finish = {
+                "type": "finish",
+                "dual_pdf_path": str(result.dual_pdf_path) if result.dual_pdf_path else None,
+                "mono_pdf_path": str(result.mono_pdf_path) if result.mono_pdf_path else None,
+            }
+            events.put(finish)
+            return
+
+def _run_translation(pdf_file: str, request_data: Dict[str, Any], output_dir: str, events):
+    """在工作进程中执行翻译，通过events队列把进度事件回传给主进程"""
+    try:
+        asyncio.run(_translate_in_worker(pdf_file, TranslationRequest(**request_data), output_dir, events))
+    finally:
+        events.put(None)
+
+async def _iter_worker_events(events, future: asyncio.Future):
+    """从工作进程的事件队列中读取事件，直到收到结束标记或工作进程退出"""
+    while True:
+        try:
+            event = await asyncio.to_thread(events.get, timeout=1.0)
+        except queue.Empty:
+            if future.done():
+                return
+            continue
+        if event is None:
+            return
+        yield event
 
 async def translate_document(
     task_id: str,
@@ -76,107 +375,103 @@ async def translate_document(
     request: TranslationRequest,
     output_dir: Path
 ):
+    status = translation_tasks[task_id]
     try:
-        translation_tasks[task_id].status = "processing"
-        translation_tasks[task_id].message = "正在初始化翻译器..."
-        
-        # 使用配置文件中的OpenAI设置
-        translator = OpenAITranslator(
-            lang_in=request.lang_in or config["translation"]["default_lang_in"],
-            lang_out=request.lang_out or config["translation"]["default_lang_out"],
-            model=config["openai"]["model"],
-            base_url=config["openai"]["base_url"],
-            api_key=config["openai"]["api_key"],
-            ignore_cache=False,
-        )
-        
-        set_translate_rate_limiter(request.qps or config["server"]["qps"])
-        
-        from babeldoc.docvision.doclayout import DocLayoutModel
-        doc_layout_model = DocLayoutModel.load_onnx()
-        
-        watermark_output_mode = request.watermark_output_mode or config["translation"]["watermark_output_mode"]
-        watermark_mode = WatermarkOutputMode.Watermarked
-        if watermark_output_mode == "no_watermark":
-            watermark_mode = WatermarkOutputMode.NoWatermark
-        elif watermark_output_mode == "both":
-            watermark_mode = WatermarkOutputMode.Both
-        
-        config_obj = TranslationConfig(
-            input_file=str(pdf_file),
-            font=None,
-            pages=None,
-            output_dir=str(output_dir),
-            translator=translator,
-            debug=False,
-            lang_in=request.lang_in or config["translation"]["default_lang_in"],
-            lang_out=request.lang_out or config["translation"]["default_lang_out"],
-            no_dual=request.no_dual if request.no_dual is not None else config["translation"]["no_dual"],
-            no_mono=request.no_mono if request.no_mono is not None else config["translation"]["no_mono"],
-            qps=request.qps or config["server"]["qps"],
-            formular_font_pattern=None,
-            formular_char_pattern=None,
-            split_short_lines=False,
-            short_line_split_factor=0.8,
-            doc_layout_model=doc_layout_model,
-            skip_clean=False,
-            dual_translate_first=False,
-            disable_rich_text_translate=False,
-            enhance_compatibility=False,
-            use_alternating_pages_dual=False,
-            report_interval=0.1,
-            min_text_length=5,
-            watermark_output_mode=watermark_mode,
-            split_strategy=None,
-            table_model=None,
-            show_char_box=False,
-            skip_scanned_detection=False,
-            ocr_workaround=False,
-            custom_system_prompt=None,
-            working_dir=None,
-            add_formula_placehold_hint=False,
-            glossaries=[],
-            pool_max_workers=None,
-            auto_extract_glossary=True,
-            auto_enable_ocr_workaround=False,
-            primary_font_family=None,
-            only_include_translated_page=False,
-            save_auto_extracted_glossary=False,
-        )
-        
-        translation_tasks[task_id].message = "正在翻译文档..."
-        
-        async for event in babeldoc.format.pdf.high_level.async_translate(config_obj):
-            if event["type"] == "progress_update":
-                translation_tasks[task_id].progress = event.get("overall_progress", 0.0)
-                translation_tasks[task_id].message = f"{event.get('stage', '处理中')} ({event.get('stage_current', 0)}/{event.get('stage_total', 100)})"
-            elif event["type"] == "error":
-                translation_tasks[task_id].status = "failed"
-                translation_tasks[task_id].message = f"翻译失败: {event.get('error', '未知错误')}"
-                logger.error(f"Translation failed for task {task_id}: {event.get('error')}")
-                return
-            elif event["type"] == "finish":
-                result = event["translate_result"]
-                translation_tasks[task_id].status = "completed"
-                translation_tasks[task_id].progress = 100.0
-                translation_tasks[task_id].message = "翻译完成"
-                
-                result_files = {}
-                if result.dual_pdf_path and Path(result.dual_pdf_path).exists():
-                    result_files["dual"] = str(result.dual_pdf_path)
-                if result.mono_pdf_path and Path(result.mono_pdf_path).exists():
-                    result_files["mono"] = str(result.mono_pdf_path)
-                
-                translation_tasks[task_id].result_files = result_files
-                task_files[task_id] = {k: Path(v) for k, v in result_files.items()}
-                
-                logger.info(f"Translation completed for task {task_id}")
-                break
-                
+        async with TRANSLATION_SEM:
+            status.status = "processing"
+            status.message = "正在初始化翻译器..."
+
+            events = _get_mp_manager().Queue()
+            loop = asyncio.get_running_loop()
+            executor = _get_executor()
+            future = loop.run_in_executor(
+                executor,
+                _run_translation,
+                str(pdf_file),
+                request.model_dump(),
+                str(output_dir),
+                events,
+            )
+
+            async for event in _iter_worker_events(events, future):
+                if event["type"] == "started":
+                    status.message = "正在翻译文档..."
+                elif event["type"] == "progress_update":
+                    status.progress = event["overall_progress"]
+                    status.message = PROGRESS_MESSAGE_TEMPLATE.format_map(event)
+                elif event["type"] == "error":
+                    status.status = "failed"
+                    status.message = f"翻译失败: {event['error']}"
+                    logger.error(f"Translation failed for task {task_id}: {event['error']}")
+                elif event["type"] == "finish":
+                    status.status = "completed"
+                    status.progress = 100.0
+                    status.message = "翻译完成"
+
+                    result_paths: Dict[str, Path] = {}
+                    for file_type in ("dual", "mono"):
+                        path_str = event[f"{file_type}_pdf_path"]
+                        if path_str:
+                            path = Path(path_str)
+                            if path.exists():
+                                result_paths[file_type] = path
+
+                    status.result_files = {k: str(v) for k, v in result_paths.items()}
+                    task_files[task_id] = result_paths
+
+                    logger.info(f"Translation completed for task {task_id}")
+
+            # 工作进程中未捕获的异常会在这里重新抛出
+            try:
+                await future
+            except BrokenProcessPool:
+                _discard_executor(executor)
+                raise
+
     except Exception as e:
-        translation_tasks[task_id].status = "failed"
-        translation_tasks[task_id].message = f"翻译过程出错: {str(e)}"
+        status.status = "failed"
+        status.message = f"翻译过程出错: {str(e)}"
         logger.error(f"Translation error for task {task_id}: {e}", exc_info=True)
+    finally:
+        task_finished_at[task_id] = time.monotonic()
+
+# 限制同时进行的上传写盘操作，使打开的文件描述符数量稳定低于ulimit -n
+FD_SEM = asyncio.BoundedSemaphore(int(os.getenv("MAX_OPEN_FILES", "256")))
+
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+def _sendfile_upload(src, buffer) -> bool:
+    """上传文件已落盘时用os.sendfile在内核中完成拷贝，不支持时返回False"""
+    if not hasattr(os, "sendfile"):
+        return False
+    # SpooledTemporaryFile只有在溢出到磁盘后才有真实的文件描述符
+    if not (getattr(src, "_rolled", False) or isinstance(src, io.BufferedReader)):
+        return False
+    try:
+        in_fd = src.fileno()
+        offset = src.tell()
+        remaining = os.fstat(in_fd).st_size - offset
+        while remaining > 0:
+            sent = os.sendfile(buffer.fileno(), in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+        return True
+    except OSError:
+        # 部分平台只支持发送到socket，回退到普通拷贝
+        buffer.seek(0)
+        buffer.truncate()
+        return False
+
+def _copy_upload(src, pdf_path: Path):
+    with open(pdf_path, "wb") as buffer:
+        if not _sendfile_upload(src, buffer):
+            shutil.copyfileobj(src, buffer, UPLOAD_COPY_BUFFER_SIZE)
+
+async def _save_upload(file: UploadFile, pdf_path: Path):
+    """在线程中将上传文件写入磁盘，避免大文件上传阻塞事件循环"""
+    await asyncio.to_thread(_copy_upload, file.file, pdf_path)
 
 @app.post("/translate", response_model=dict)
 async def translate_pdf(
@@ -192,15 +487,15 @@ async def translate_pdf(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="只支持PDF文件")
     
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     
     temp_dir = Path(tempfile.mkdtemp())
     pdf_path = temp_dir / file.filename
     output_dir = temp_dir / "output"
     output_dir.mkdir(exist_ok=True)
     
-    with open(pdf_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    async with FD_SEM:
+        await _save_upload(file, pdf_path)
     
     request = TranslationRequest(
         lang_in=lang_in,
@@ -216,6 +511,8 @@ async def translate_pdf(
         status="pending",
         message="任务已创建，等待处理..."
     )
+    task_dirs[task_id] = temp_dir
+    await _evict_lru_tasks()
     
     background_tasks.add_task(
         translate_document,
@@ -227,12 +524,69 @@ async def translate_pdf(
     
     return {"task_id": task_id, "message": "翻译任务已创建"}
 
-@app.get("/status/{task_id}", response_model=TranslationStatus)
-async def get_translation_status(task_id: str):
+LONG_POLL_MAX_TIMEOUT = 60.0
+LONG_POLL_CHECK_INTERVAL = 0.2
+
+@app.get("/status/{task_id}", response_model=TranslationStatusOut)
+async def get_translation_status(
+    task_id: str,
+    wait_for_change_since: Optional[float] = None,
+    timeout: float = 30.0
+):
+    """查询任务状态
+
+    传入wait_for_change_since时为长轮询：服务器会保持请求，直到进度不同于该值、
+    任务结束或超过timeout秒后再返回。
+    """
+    if task_id not in translation_tasks:
+        raise HTTPException(status_code=404, detail="任务不存在")
+    
+    translation_tasks.move_to_end(task_id)
+    status = translation_tasks[task_id]
+    
+    if wait_for_change_since is not None:
+        deadline = time.monotonic() + min(max(timeout, 0.0), LONG_POLL_MAX_TIMEOUT)
+        while (
+            status.progress == wait_for_change_since
+            and status.status not in ("completed", "failed")
+            and time.monotonic() < deadline
+        ):
+            await asyncio.sleep(LONG_POLL_CHECK_INTERVAL)
+    
+    # 直接返回Response时FastAPI不再按response_model重新校验和序列化，response_model只用于生成接口文档
+    return JSONResponse(asdict(status))
+
+SSE_HEARTBEAT_SECS = 15.0
+
+async def _iter_status_events(status: TranslationStatus):
+    """状态变化时推送一条SSE事件，任务结束后关闭流；长时间无变化时发送注释行保持连接"""
+    last = None
+    last_sent = time.monotonic()
+    while True:
+        current = (status.status, status.progress, status.message)
+        if current != last:
+            last = current
+            last_sent = time.monotonic()
+            yield f"data: {json.dumps(asdict(status), ensure_ascii=False)}\n\n"
+            if status.status in ("completed", "failed"):
+                return
+        elif time.monotonic() - last_sent >= SSE_HEARTBEAT_SECS:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+        await asyncio.sleep(LONG_POLL_CHECK_INTERVAL)
+
+@app.get("/stream/{task_id}")
+async def stream_translation_status(task_id: str):
+    """以Server-Sent Events推送任务状态，客户端无需轮询"""
     if task_id not in translation_tasks:
         raise HTTPException(status_code=404, detail="任务不存在")
     
-    return translation_tasks[task_id]
+    translation_tasks.move_to_end(task_id)
+    return StreamingResponse(
+        _iter_status_events(translation_tasks[task_id]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/download/{task_id}/{file_type}")
 async def download_result(task_id: str, file_type: str):
@@ -247,15 +601,56 @@ async def download_result(task_id: str, file_type: str):
     
     file_path = task_files[task_id][file_type]
     
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="文件不存在")
+    # 只stat一次，结果同时用于存在性检查以及FileResponse的Content-Length、Last-Modified和ETag；
+    # FileResponse支持Range请求，中断的大文件下载可以续传
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="文件不存在") from None
     
     return FileResponse(
         path=file_path,
         filename=file_path.name,
-        media_type='application/pdf'
+        media_type='application/pdf',
+        stat_result=st
     )
 
+def _read_thumbnails(paths: List[Path]) -> List[str]:
+    return [base64.b64encode(p.read_bytes()).decode("ascii") for p in paths]
+
+@app.get("/thumbnails/{task_id}/{file_type}")
+async def get_thumbnails(task_id: str, file_type: str):
+    """返回翻译结果每一页的JPEG缩略图（base64编码）
+
+    缩略图在首次请求时只为所请求的文件类型生成，之后从output_dir/thumbnails/<类型>下的缓存读取。
+    """
+    if task_id not in translation_tasks:
+        raise HTTPException(status_code=404, detail="任务不存在")
+    
+    if translation_tasks[task_id].status != "completed":
+        raise HTTPException(status_code=400, detail="翻译尚未完成")
+    
+    pdf_path = task_files.get(task_id, {}).get(file_type)
+    if pdf_path is None:
+        raise HTTPException(status_code=404, detail="文件不存在")
+    
+    renders = task_thumbnails.setdefault(task_id, {})
+    render = renders.get(file_type)
+    if render is None:
+        thumb_dir = task_dirs[task_id] / "output" / "thumbnails" / file_type
+        render = renders[file_type] = asyncio.create_task(asyncio.to_thread(_render_thumbnails, pdf_path, thumb_dir))
+    try:
+        paths = await asyncio.shield(render)
+    except Exception as e:
+        # 缩略图只用于预览，生成失败时客户端会在本地渲染；移除记录以便下次请求重试
+        if renders.get(file_type) is render:
+            del renders[file_type]
+        logger.warning(f"Thumbnail rendering failed for task {task_id} ({file_type}): {e}")
+        raise HTTPException(status_code=404, detail="缩略图不存在") from None
+    
+    thumbnails = await asyncio.to_thread(_read_thumbnails, paths)
+    return {"task_id": task_id, "file_type": file_type, "thumbnails": thumbnails}
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "BabelDOC Translation API"}
@@ -274,7 +669,9 @@ async def root():
         "endpoints": {
             "translate": "POST /translate - 上传PDF文件进行翻译",
             "status": "GET /status/{task_id} - 查询翻译状态",
+            "stream": "GET /stream/{task_id} - 以Server-Sent Events推送任务状态",
             "download": "GET /download/{task_id}/{file_type} - 下载翻译结果",
+            "thumbnails": "GET /thumbnails/{task_id}/{file_type} - 获取翻译结果每页的JPEG缩略图",
             "health": "GET /health - 健康检查"
         }
     }
@@ -348,8 +745,6 @@ def start_server(host: Optional[str] = None, port: Optional[int] = None):
         logger.warning(f"字体缓存预加载失败: {e}")
         logger.info("字体将在运行时动态加载")
 
-    babeldoc.format.pdf.high_level.init()
-
     logging.basicConfig(level=logging.INFO)
     logging.getLogger("httpx").setLevel("WARNING")
     logging.getLogger("openai").setLevel("WARNING")
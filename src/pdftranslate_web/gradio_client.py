@@ -1,35 +1,103 @@
+import asyncio
+import atexit
 import gradio as gr
+import hashlib
+import multiprocessing
 import os
+import shutil
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
-import fitz  # PyMuPDF
-import base64
-from io import BytesIO
-from PIL import Image
+from typing import Optional, Tuple, Dict, List, Iterator, AsyncIterator
 
+from pdftranslate_web import render
 from pdftranslate_web.api_client import BabelDOCClient
-import json
 
 # 管理员密码配置
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "zhouqingYu666")
 
+# 项目根目录与示例文件路径，模块导入时计算一次
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_SAMPLE_FILE = _PROJECT_ROOT / "simaple" / "11.pdf"
+
+# 界面样式，模块导入时读取一次
+_APP_CSS = (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+# 任务状态查询结果模板
+_STATUS_TMPL = "\n**任务状态:** %s\n**进度:** %.1f%%\n**消息:** %s\n**结果文件:** %s\n"
+
+# 内存中记录的已缓存缩略图路径数量上限，命中时无需再访问磁盘
+THUMB_CACHE_SIZE = 4096
+
+# 服务器状态缓存时间（秒），页面频繁刷新时不必每次都请求服务器；
+# 查询失败时缓存时间更短，服务器恢复后能尽快反映出来
+STATUS_CACHE_TTL = 5.0
+STATUS_FAILURE_TTL = 1.0
+
+# Gallery缩略图只有约400px高，默认按0.5倍渲染即可
+PREVIEW_ZOOM = 0.5
+
+# 上传预览首次只渲染前几页，其余页面点击"加载更多"时按需渲染
+PREVIEW_INITIAL_PAGES = 4
+PREVIEW_MORE_PAGES = 8
+
+# 翻译任务的最长等待时间（秒）
+TRANSLATE_TIMEOUT = 3600
+
+# 文件内容哈希缓存的条目数上限
+HASH_CACHE_SIZE = 256
+
+# 未命中缓存的页数不超过此值时直接在当前线程渲染，启动渲染子进程的开销远大于渲染几页本身
+INLINE_RENDER_PAGES = 8
+
 class GradioClient:
     def __init__(self, server_url: str = "http://localhost:8000"):
         self.client = BabelDOCClient(server_url)
         self.temp_dir = Path(tempfile.mkdtemp())
+        # 缩略图缓存、示例文件副本和下载结果都在此目录下，进程退出时一并清理
+        atexit.register(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.current_task_id = None
-        # 获取项目根目录路径
-        self.project_root = Path(__file__).parent.parent.parent
-        self.sample_file_path = self.project_root / "simaple" / "11.pdf"
+        self.project_root = _PROJECT_ROOT
+        self.sample_file_path = _SAMPLE_FILE
+        # 预览缩略图缓存：磁盘JPEG交给Gallery按路径加载，内存LRU只记录已存在的文件路径，
+        # 键为 (文件内容哈希, 页码, 缩放比例)
+        self._thumb_cache: "OrderedDict[Tuple[str, int, float], str]" = OrderedDict()
+        self._thumb_dir = self.temp_dir / "thumb_cache"
+        self._thumb_dir.mkdir(exist_ok=True)
+        # 页面光栅化是CPU密集型操作，页数较多时分发到进程池并行渲染；进程池按需创建，
+        # 工作进程数不超过待渲染页数
+        self._pool_workers = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        atexit.register(self._shutdown_pool)
+        # (过期时间, 结果)，Gradio在线程池中执行事件处理，用锁保证同一时刻只有一个请求在查询
+        self._status_cache: Optional[Tuple[float, Tuple[str, Dict]]] = None
+        self._status_lock = threading.Lock()
+        # 文件内容哈希缓存 {路径: (修改时间, 大小, 哈希)}，示例文件等重复加载时不必再整体读取
+        self._hash_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        # Gradio事件处理线程、预热线程和to_thread会同时访问上面两个缓存
+        self._cache_lock = threading.Lock()
         
         
     def check_server_status(self) -> Tuple[str, Dict]:
         """检查服务器状态和配置"""
+        with self._status_lock:
+            if self._status_cache and time.time() < self._status_cache[0]:
+                return self._status_cache[1]
+            
+            result, ttl = self._fetch_server_status()
+            self._status_cache = (time.time() + ttl, result)
+            return result
+    
+    def _fetch_server_status(self) -> Tuple[Tuple[str, Dict], float]:
         try:
             if not self.client.health_check():
-                return "❌ 服务器离线", {}
+                return ("❌ 服务器离线", {}), STATUS_FAILURE_TTL
             
             config = self.client.get_server_config()
             
@@ -40,63 +108,204 @@ class GradioClient:
 - 默认语言: {config['config']['default_lang_in']} → {config['config']['default_lang_out']}
 - QPS限制: {config['config']['qps']}
 """
-            return status_text, config['config']
+            return (status_text, config['config']), STATUS_CACHE_TTL
         except Exception as e:
-            return f"❌ 连接失败: {str(e)}", {}
+            return (f"❌ 连接失败: {str(e)}", {}), STATUS_FAILURE_TTL
+    
+    def _file_hash(self, pdf_path: str) -> str:
+        """按文件内容计算哈希，同一文件在不同路径下共享缓存"""
+        st = os.stat(pdf_path)
+        with self._cache_lock:
+            cached = self._hash_cache.get(pdf_path)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self._hash_cache.move_to_end(pdf_path)
+                return cached[2]
+        
+        h = hashlib.blake2b(digest_size=16)
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        with self._cache_lock:
+            self._hash_cache[pdf_path] = (st.st_mtime_ns, st.st_size, h.hexdigest())
+            while len(self._hash_cache) > HASH_CACHE_SIZE:
+                self._hash_cache.popitem(last=False)
+        return h.hexdigest()
     
-    def pdf_to_images(self, pdf_path: str, max_pages: int = None) -> list:
-        """将PDF转换为图片预览"""
-        if not pdf_path or not os.path.exists(pdf_path):
-            return []
+    def _thumb_path(self, pdf_hash: str, page_num: int, zoom: float) -> Path:
+        return self._thumb_dir / f"{pdf_hash}_{page_num}_{zoom}.jpg"
+    
+    def _get_cached_page(self, pdf_hash: str, page_num: int, zoom: float) -> Optional[str]:
+        """依次查找内存LRU和磁盘缓存，命中返回缩略图路径，未命中返回None"""
+        key = (pdf_hash, page_num, zoom)
+        with self._cache_lock:
+            path = self._thumb_cache.get(key)
+            if path is not None:
+                self._thumb_cache.move_to_end(key)
+                return path
         
+        thumb_path = self._thumb_path(pdf_hash, page_num, zoom)
+        if not thumb_path.exists():
+            return None
+        self._remember_page(key, str(thumb_path))
+        return str(thumb_path)
+    
+    def _remember_page(self, key: Tuple[str, int, float], path: str):
+        with self._cache_lock:
+            self._thumb_cache[key] = path
+            while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+    
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """返回至少有workers个工作进程（不超过CPU核数）的进程池，不够时换成更大的进程池"""
+        workers = min(workers, os.cpu_count() or 1)
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers < workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                self._pool_workers = workers
+            return self._pool
+    
+    def _shutdown_pool(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+    
+    def pdf_to_images(
+        self, pdf_path: str, max_pages: int = None, zoom: float = PREVIEW_ZOOM, start: int = 0
+    ) -> list:
+        """将PDF转换为图片预览，返回缩略图文件路径列表"""
+        return list(self.iter_pdf_images(pdf_path, max_pages, zoom, start))
+    
+    def page_count(self, pdf_path: str) -> int:
+        """返回PDF页数，文件无法打开时返回0"""
         try:
-            doc = fitz.open(pdf_path)
-            images = []
+            return render.page_count(pdf_path)
+        except Exception:
+            return 0
+    
+    def iter_pdf_images(
+        self, pdf_path: str, max_pages: int = None, zoom: float = PREVIEW_ZOOM, start: int = 0
+    ) -> Iterator[str]:
+        """从第start页起按页码顺序逐页产出最多max_pages页的预览图片路径，前面的页面渲染完即可先展示。
+        
+        Gallery按路径让浏览器加载图片，预览不再在内存中保存整份PDF的页面像素。
+        """
+        if not pdf_path:
+            return
+        
+        # 文件不存在时由_file_hash中的stat抛出FileNotFoundError，无需预先检查
+        try:
+            pdf_hash = self._file_hash(pdf_path)
+            page_count = render.page_count(pdf_path)
             
-            num_pages = len(doc) if max_pages is None else min(len(doc), max_pages)
-            for page_num in range(num_pages):
-                page = doc[page_num]
-                # 设置缩放比例以获得合适的预览大小
-                mat = fitz.Matrix(1.5, 1.5)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
-                
-                # 转换为PIL Image
-                img = Image.open(BytesIO(img_data))
-                images.append(img)
+            end = page_count if max_pages is None else min(page_count, start + max_pages)
+            page_nums = range(start, end)
+            pages: List[Optional[str]] = [
+                self._get_cached_page(pdf_hash, page_num, zoom) for page_num in page_nums
+            ]
             
-            doc.close()
-            return images
+            missing = [page_num for page_num, path in zip(page_nums, pages) if path is None]
+            thumb_paths = [str(self._thumb_path(pdf_hash, page_num, zoom)) for page_num in missing]
+            if len(missing) <= INLINE_RENDER_PAGES:
+                rendered = map(render.render_page, repeat(pdf_path), missing, repeat(zoom), thumb_paths)
+            else:
+                # 未命中缓存的页面一次性全部提交并行渲染，按连续页码分块派发以减少进程间通信，
+                # map按提交顺序返回结果，前面的页面完成即可先展示
+                pool = self._get_pool(len(missing))
+                rendered = pool.map(
+                    render.render_page,
+                    repeat(pdf_path),
+                    missing,
+                    repeat(zoom),
+                    thumb_paths,
+                    chunksize=max(1, len(missing) // (self._pool_workers * 4))
+                )
+            for page_num, path in zip(page_nums, pages):
+                if path is None:
+                    path = next(rendered)
+                    self._remember_page((pdf_hash, page_num, zoom), path)
+                
+                yield path
         except Exception as e:
             print(f"PDF预览失败: {e}")
-            return []
     
-    def translate_pdf(
+    def _store_thumbnails(self, pdf_path: str, thumbnails: List[bytes]) -> List[str]:
+        """把服务器生成的缩略图写入缓存目录（与本地0.5倍预览共用缓存键），返回文件路径"""
+        pdf_hash = self._file_hash(pdf_path)
+        paths = []
+        for page_num, data in enumerate(thumbnails):
+            thumb_path = self._thumb_path(pdf_hash, page_num, PREVIEW_ZOOM)
+            tmp_path = thumb_path.with_name(f"{thumb_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, thumb_path)
+            self._remember_page((pdf_hash, page_num, PREVIEW_ZOOM), str(thumb_path))
+            paths.append(str(thumb_path))
+        return paths
+    
+    async def _download_result(
+        self, task_id: str, ftype: str, output_file: str, preview: bool
+    ) -> Tuple[bool, Optional[List[str]]]:
+        """下载结果文件，返回 (是否下载成功, 服务器缩略图路径)。
+        
+        preview为True时同时获取服务器生成的缩略图；未请求预览或服务器未提供时缩略图为None，
+        由调用方在本地逐页渲染。
+        """
+        if preview:
+            # 与下载同时获取服务器已生成的预览缩略图
+            download, thumbnails = await asyncio.gather(
+                asyncio.to_thread(self.client.download_result, task_id, ftype, output_file),
+                asyncio.to_thread(self.client.get_thumbnails, task_id, ftype)
+            )
+        else:
+            download = await asyncio.to_thread(self.client.download_result, task_id, ftype, output_file)
+        
+        if not download or not preview or not thumbnails:
+            return bool(download), None
+        return True, await asyncio.to_thread(self._store_thumbnails, output_file, thumbnails)
+    
+    @staticmethod
+    def _format_timing(start: float, end: float, label: str = "完成") -> str:
+        """格式化耗时统计信息，仅在任务结束时调用一次"""
+        duration = end - start
+        return (
+            f"开始时间: {time.strftime('%H:%M:%S', time.localtime(start))} | "
+            f"{label}时间: {time.strftime('%H:%M:%S', time.localtime(end))} | "
+            f"{'总' if label == '完成' else ''}耗时: {int(duration//60)}分{int(duration%60)}秒"
+        )
+    
+    async def translate_pdf(
         self, 
         pdf_file, 
         lang_in: Optional[str] = None,
         lang_out: Optional[str] = None,
         file_type: str = "dual",
         progress=gr.Progress()
-    ) -> Tuple[str, str, list, str, str]:
-        """翻译PDF文件"""
+    ) -> AsyncIterator[Tuple[str, str, list, str, str]]:
+        """翻译PDF文件，依次产出 (状态, 结果文件路径, 预览图片, 任务ID, 耗时) ，最后一项为最终结果。
+        
+        中间的预览更新中结果文件路径、任务ID和耗时为None，表示保持不变。
+        """
         if pdf_file is None:
-            return "❌ 请先上传PDF文件", "", [], "", ""
+            yield "❌ 请先上传PDF文件", "", [], "", ""
+            return
         
         try:
             # 记录开始时间
             start_time = time.time()
-            start_time_str = time.strftime("%H:%M:%S", time.localtime(start_time))
             
             progress(0, desc="正在提交翻译任务...")
             
-            # 保存上传的文件
-            pdf_path = self.temp_dir / f"input_{int(time.time())}.pdf"
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_file)
+            # Gradio已将上传内容写入临时文件，直接使用其路径
+            pdf_path = pdf_file
             
             # 提交翻译任务
-            task_id = self.client.translate_pdf(
+            task_id = await asyncio.to_thread(
+                self.client.translate_pdf,
                 pdf_path=str(pdf_path),
                 lang_in=lang_in if lang_in else None,
                 lang_out=lang_out if lang_out else None
@@ -105,84 +314,105 @@ class GradioClient:
             
             progress(0.1, desc=f"任务已创建: {task_id[:8]}...")
             
-            # 监控翻译进度
-            while time.time() - start_time < 3600:  # 1小时超时
-                status = self.client.get_status(task_id)
-                
-                if status['status'] == 'completed':
-                    progress(1.0, desc="翻译完成，正在下载结果...")
-                    
-                    # 记录结束时间
-                    end_time = time.time()
-                    end_time_str = time.strftime("%H:%M:%S", time.localtime(end_time))
-                    duration = end_time - start_time
-                    duration_str = f"{int(duration//60)}分{int(duration%60)}秒"
-                    
-                    timing_info = f"开始时间: {start_time_str} | 完成时间: {end_time_str} | 总耗时: {duration_str}"
-                    
-                    # 下载结果文件
-                    output_dir = self.temp_dir / f"output_{task_id[:8]}"
-                    output_dir.mkdir(exist_ok=True)
+            # 监控翻译进度（订阅服务器推送的状态事件，无需轮询）
+            async with aclosing(self.client.stream_status(task_id)) as statuses:
+                while True:
+                    # 截止时间作用在每次等待上：任务卡住时推送流可能长时间没有任何事件
+                    try:
+                        status = await asyncio.wait_for(
+                            anext(statuses), start_time + TRANSLATE_TIMEOUT - time.time()
+                        )
+                    except (StopAsyncIteration, asyncio.TimeoutError):
+                        break
                     
-                    downloaded_files = {}
-                    for ftype in ['dual', 'mono']:
-                        if ftype in status['result_files']:
-                            output_file = output_dir / f"translated_{ftype}.pdf"
-                            if self.client.download_result(task_id, ftype, str(output_file)):
-                                downloaded_files[ftype] = str(output_file)
+                    if status['status'] == 'completed':
+                        progress(1.0, desc="翻译完成，正在下载结果...")
+                        
+                        # 记录结束时间
+                        timing_info = self._format_timing(start_time, time.time(), "完成")
+                        
+                        # 下载结果文件
+                        output_dir = self.temp_dir / f"output_{task_id[:8]}"
+                        output_dir.mkdir(exist_ok=True)
+                        
+                        # 两种结果文件互不依赖，并发下载
+                        targets = {
+                            ftype: str(output_dir / f"translated_{ftype}.pdf")
+                            for ftype in ['dual', 'mono'] if ftype in status['result_files']
+                        }
+                        # 目标类型下载完成后立即生成预览，与另一个文件的下载重叠进行
+                        results = await asyncio.gather(*(
+                            self._download_result(task_id, ftype, output_file, preview=(ftype == file_type))
+                            for ftype, output_file in targets.items()
+                        ))
+                        downloaded_files = {
+                            ftype: (output_file, images)
+                            for (ftype, output_file), (ok, images) in zip(targets.items(), results) if ok
+                        }
+                        
+                        # 返回指定类型的文件
+                        if file_type in downloaded_files:
+                            result_path, result_images = downloaded_files[file_type]
+                            
+                            if result_images is None:
+                                # 服务器未提供缩略图时在本地渲染，不必等整份PDF渲染结束才显示第一页。
+                                # Gradio每次更新都会重新哈希Gallery中的全部文件，按1、2、4、8...页
+                                # 成倍推送，总哈希量与页数成线性；中间更新只带状态和预览（其余为None）
+                                result_images = []
+                                next_push = 1
+                                pages = self.iter_pdf_images(result_path)
+                                while (img := await asyncio.to_thread(next, pages, None)) is not None:
+                                    result_images.append(img)
+                                    if len(result_images) == next_push:
+                                        next_push *= 2
+                                        yield (
+                                            f"✅ 翻译完成，已渲染 {len(result_images)} 页预览...",
+                                            None,
+                                            list(result_images),
+                                            None,
+                                            None
+                                        )
+                            
+                            yield (
+                                f"✅ 翻译完成！共生成 {len(result_images)} 页内容",
+                                result_path,
+                                result_images,
+                                f"任务ID: {task_id}",
+                                timing_info
+                            )
+                        else:
+                            yield (
+                                f"⚠️ 翻译完成但未找到 {file_type} 文件类型",
+                                "",
+                                [],
+                                f"任务ID: {task_id}",
+                                timing_info
+                            )
+                        return
                     
-                    # 返回指定类型的文件
-                    if file_type in downloaded_files:
-                        result_path = downloaded_files[file_type]
-                        result_images = self.pdf_to_images(result_path)
+                    elif status['status'] == 'failed':
+                        timing_info = self._format_timing(start_time, time.time(), "失败")
                         
-                        return (
-                            f"✅ 翻译完成！共生成 {len(result_images)} 页内容",
-                            result_path,
-                            result_images,
-                            f"任务ID: {task_id}",
-                            timing_info
-                        )
-                    else:
-                        return (
-                            f"⚠️ 翻译完成但未找到 {file_type} 文件类型",
+                        yield (
+                            f"❌ 翻译失败: {status['message']}",
                             "",
                             [],
                             f"任务ID: {task_id}",
                             timing_info
                         )
-                
-                elif status['status'] == 'failed':
-                    end_time = time.time()
-                    end_time_str = time.strftime("%H:%M:%S", time.localtime(end_time))
-                    duration = end_time - start_time
-                    duration_str = f"{int(duration//60)}分{int(duration%60)}秒"
-                    timing_info = f"开始时间: {start_time_str} | 失败时间: {end_time_str} | 耗时: {duration_str}"
+                        return
                     
-                    return (
-                        f"❌ 翻译失败: {status['message']}",
-                        "",
-                        [],
-                        f"任务ID: {task_id}",
-                        timing_info
-                    )
-                
-                # 更新进度
-                progress_val = status['progress'] / 100.0
-                progress(progress_val, desc=f"{status['message']}")
-                time.sleep(2)
+                    # 更新进度
+                    progress_val = status['progress'] / 100.0
+                    progress(progress_val, desc=f"{status['message']}")
             
-            # 超时情况
-            end_time = time.time()
-            end_time_str = time.strftime("%H:%M:%S", time.localtime(end_time))
-            duration = end_time - start_time
-            duration_str = f"{int(duration//60)}分{int(duration%60)}秒"
-            timing_info = f"开始时间: {start_time_str} | 超时时间: {end_time_str} | 耗时: {duration_str}"
+            # 超时或推送流提前结束
+            timing_info = self._format_timing(start_time, time.time(), "超时")
             
-            return "❌ 翻译超时", "", [], f"任务ID: {task_id}", timing_info
+            yield "❌ 翻译超时", "", [], f"任务ID: {task_id}", timing_info
             
         except Exception as e:
-            return f"❌ 翻译出错: {str(e)}", "", [], "", ""
+            yield f"❌ 翻译出错: {str(e)}", "", [], "", ""
     
     def get_task_status(self, task_id: str) -> str:
         """获取任务状态"""
@@ -191,53 +421,68 @@ class GradioClient:
         
         try:
             status = self.client.get_status(task_id)
-            return f"""
-**任务状态:** {status['status']}
-**进度:** {status['progress']:.1f}%
-**消息:** {status['message']}
-**结果文件:** {', '.join(status['result_files'].keys()) if status['result_files'] else '无'}
-"""
+            return _STATUS_TMPL % (
+                status['status'],
+                status['progress'],
+                status['message'],
+                ', '.join(status['result_files']) or '无'
+            )
         except Exception as e:
             return f"查询失败: {str(e)}"
     
-    def load_sample_file(self) -> Tuple[bytes, list, str]:
-        """加载示例PDF文件"""
+    def _place_sample_copy(self) -> str:
+        """在临时目录中放一份示例文件并返回其路径，示例文件不存在时抛出FileNotFoundError。
+        
+        Gradio只允许访问工作目录和临时目录中的文件。优先创建硬链接（不复制任何数据），
+        跨文件系统等无法链接时再用copyfile（Linux上走sendfile）。直接尝试链接，由异常区分
+        "已存在"和"示例文件不存在"，不再单独stat。
+        """
+        sample_copy = self.temp_dir / self.sample_file_path.name
         try:
-            if not self.sample_file_path.exists():
-                return None, [], "❌ 示例文件不存在"
-            
-            # 读取示例文件
-            with open(self.sample_file_path, "rb") as f:
-                file_data = f.read()
-            
-            # 生成预览图片
-            images = self.pdf_to_images(str(self.sample_file_path))
-            status = f"✅ 已加载示例文件，共 {len(images)} 页"
+            os.link(self.sample_file_path, sample_copy)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(self.sample_file_path, sample_copy)
+        return str(sample_copy)
+    
+    def load_sample_file(self) -> Iterator[Tuple[Optional[str], list, str]]:
+        """加载示例PDF文件，逐页产出前PREVIEW_INITIAL_PAGES页的预览图片"""
+        try:
+            # 预览只需要路径，直接渲染原文件（缩略图按内容哈希缓存，与副本共用），
+            # 同时在后台线程中放置副本，两者重叠进行
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                copy_future = executor.submit(self._place_sample_copy)
+                images = []
+                for img in self.iter_pdf_images(str(self.sample_file_path), PREVIEW_INITIAL_PAGES):
+                    images.append(img)
+                    yield copy_future.result(), images, f"已渲染 {len(images)} 页..."
+                sample_path = copy_future.result()
             
-            return file_data, images, status
+            yield sample_path, images, f"✅ 已加载示例文件，共 {self.page_count(sample_path)} 页"
+        except FileNotFoundError:
+            yield None, [], "❌ 示例文件不存在"
         except Exception as e:
-            return None, [], f"❌ 加载示例文件失败: {str(e)}"
+            yield None, [], f"❌ 加载示例文件失败: {str(e)}"
 
 def create_gradio_interface(server_url: str = "http://localhost:8000"):
     """创建Gradio界面"""
     gradio_client = GradioClient(server_url)
     
+    # 示例文件固定不变，后台预先渲染其预览填充缩略图缓存，用户点击加载时直接命中
+    if gradio_client.sample_file_path.exists():
+        threading.Thread(
+            target=gradio_client.pdf_to_images,
+            args=(str(gradio_client.sample_file_path), PREVIEW_INITIAL_PAGES),
+            daemon=True
+        ).start()
+    
     with gr.Blocks(
         title="pdftranslate PDF翻译工具",
         theme=gr.themes.Soft(),
-        css="""
-        .main-container { max-width: 1400px; margin: 0 auto; }
-        .preview-container { height: 600px; overflow-y: auto; }
-        .status-box { background-color: #f8f9fa; padding: 15px; border-radius: 8px; }
-        
-        /* 隐藏Gradio底部标志 */
-        .footer { display: none !important; }
-        .gradio-container .footer { display: none !important; }
-        footer { display: none !important; }
-        .gradio-container footer { display: none !important; }
-        .gradio-container .gradio-footer { display: none !important; }
-        .gradio-footer { display: none !important; }
-        """
+        css=_APP_CSS
     ) as demo:
         
         gr.Markdown("""
@@ -308,7 +553,7 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
                         pdf_input = gr.File(
                             label="拖放PDF文件至此或点击选择",
                             file_types=[".pdf"],
-                            type="binary"
+                            type="filepath"
                         )
                         
                         # 原始PDF预览
@@ -323,6 +568,9 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
                             show_download_button=False,
                             interactive=False
                         )
+                        load_more_btn = gr.Button("⬇️ 加载更多页面", size="sm", visible=False)
+                        # 当前已展示的预览图片路径
+                        preview_pages = gr.State([])
                         
                     # 右侧：结果展示
                     with gr.Column(scale=1):
@@ -386,66 +634,85 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
         
         # 事件处理
         def on_pdf_upload(pdf_file):
-            """PDF文件上传时的预览"""
+            """PDF文件上传时的预览，只渲染前几页"""
             if pdf_file is None:
-                return [], "等待上传文件..."
+                yield [], "等待上传文件...", [], gr.update(visible=False)
+                return
             
-            # 保存临时文件用于预览
-            temp_path = gradio_client.temp_dir / f"preview_{int(time.time())}.pdf"
-            with open(temp_path, "wb") as f:
-                f.write(pdf_file)
+            # 生成预览图片，每渲染完一页就推送给Gallery
+            images = []
+            for img in gradio_client.iter_pdf_images(pdf_file, PREVIEW_INITIAL_PAGES):
+                images.append(img)
+                yield images, f"已渲染 {len(images)} 页...", images, gr.update()
             
-            # 生成预览图片
-            images = gradio_client.pdf_to_images(str(temp_path))
-            status = f"✅ 已上传PDF文件，共 {len(images)} 页"
+            total = gradio_client.page_count(pdf_file)
+            yield images, f"✅ 已上传PDF文件，共 {total} 页", images, gr.update(visible=len(images) < total)
+        
+        def on_load_more(pdf_file, shown):
+            """按需渲染后续页面"""
+            if pdf_file is None:
+                yield shown, "等待上传文件...", shown, gr.update(visible=False)
+                return
             
-            return images, status
+            total = gradio_client.page_count(pdf_file)
+            images = list(shown)
+            for img in gradio_client.iter_pdf_images(pdf_file, PREVIEW_MORE_PAGES, start=len(shown)):
+                images.append(img)
+                yield images, f"已渲染 {len(images)} / {total} 页...", images, gr.update()
+            
+            yield images, f"✅ 已显示 {len(images)} / {total} 页", images, gr.update(visible=len(images) < total)
         
         def on_load_sample():
             """加载示例文件"""
-            file_data, images, status = gradio_client.load_sample_file()
-            if file_data:
-                # 创建临时文件并返回其路径给gr.File组件
-                temp_sample_path = gradio_client.temp_dir / f"sample_{int(time.time())}.pdf"
-                with open(temp_sample_path, "wb") as f:
-                    f.write(file_data)
-                return str(temp_sample_path), images, status
-            else:
-                return None, [], status
+            sent_path = False
+            for sample_path, images, status in gradio_client.load_sample_file():
+                # 文件组件只在首次更新，避免重复触发上传预览事件
+                yield (gr.update() if sent_path else sample_path), images, status, images
+                sent_path = sample_path is not None
         
-        def on_translate(pdf_file, lang_in, lang_out, file_type, progress=gr.Progress()):
-            """执行翻译"""
-            status, result_path, result_images, task_id, timing_info = gradio_client.translate_pdf(
-                pdf_file, lang_in, lang_out, file_type, progress
-            )
-            
-            # 返回结果
-            download_visible = bool(result_path and os.path.exists(result_path))
-            task_visible = bool(task_id)
-            
-            # 格式化时间信息显示
-            timing_display_text = f"⏱️ **处理时间统计**：{timing_info}" if timing_info else "⏱️ **处理时间统计**：处理异常"
-            
-            return (
-                status,  # translation_status
-                result_images,  # result_preview
-                gr.File(value=result_path if result_path else None, visible=download_visible),  # download_btn
-                gr.Textbox(value=task_id, visible=task_visible),  # task_info
-                timing_display_text  # timing_display
-            )
+        async def on_translate(pdf_file, lang_in, lang_out, file_type, progress=gr.Progress()):
+            """执行翻译，结果预览逐页更新"""
+            async with aclosing(
+                gradio_client.translate_pdf(pdf_file, lang_in, lang_out, file_type, progress)
+            ) as updates:
+                async for status, result_path, result_images, task_id, timing_info in updates:
+                    if result_path is None:
+                        # 中间更新只刷新状态和预览，结果文件在最后一次更新时才发送
+                        yield status, result_images, gr.update(), gr.update(), gr.update()
+                        continue
+                    
+                    download_visible = bool(result_path and os.path.exists(result_path))
+                    task_visible = bool(task_id)
+                    
+                    # 格式化时间信息显示
+                    timing_display_text = f"⏱️ **处理时间统计**：{timing_info}" if timing_info else "⏱️ **处理时间统计**：处理异常"
+                    
+                    yield (
+                        status,  # translation_status
+                        result_images,  # result_preview
+                        gr.File(value=result_path if result_path else None, visible=download_visible),  # download_btn
+                        gr.Textbox(value=task_id, visible=task_visible),  # task_info
+                        timing_display_text  # timing_display
+                    )
         
         # 绑定事件
         
         # 示例文件加载
         sample_btn.click(
             on_load_sample,
-            outputs=[pdf_input, original_preview, translation_status]
+            outputs=[pdf_input, original_preview, translation_status, preview_pages]
         )
         
         pdf_input.change(
             on_pdf_upload,
             inputs=[pdf_input],
-            outputs=[original_preview, translation_status]
+            outputs=[original_preview, translation_status, preview_pages, load_more_btn]
+        )
+        
+        load_more_btn.click(
+            on_load_more,
+            inputs=[pdf_input, preview_pages],
+            outputs=[original_preview, translation_status, preview_pages, load_more_btn]
         )
         
         translate_btn.click(
@@ -466,9 +733,12 @@ def main():
     """启动Gradio客户端"""
     import argparse
     
-    # 显示管理员密码信息
+    # 显示管理员密码信息（不输出密码本身）
     print("---" * 10)
-    print(f"INFO: 管理员密码已设置。请使用 '{ADMIN_PASSWORD}' 在参数设置页面解锁敏感信息。")
+    if "ADMIN_PASSWORD" in os.environ:
+        print("INFO: 管理员密码已通过 ADMIN_PASSWORD 环境变量设置，可在参数设置页面解锁敏感信息。")
+    else:
+        print("WARNING: 未设置 ADMIN_PASSWORD 环境变量，正在使用默认管理员密码，请尽快修改。")
     print("---" * 10)
     
     parser = argparse.ArgumentParser(description="BabelDOC Gradio客户端")
@@ -1,3 +1,4 @@
+import functools
 import gradio as gr
 import os
 import tempfile
@@ -5,16 +6,35 @@ import time
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 import fitz  # PyMuPDF
-import base64
 from io import BytesIO
 from PIL import Image
 
+from dotenv import load_dotenv
+
 from pdftranslate_web.api_client import BabelDOCClient
-import json
 
 # 管理员密码配置
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "zhouqingYu666")
 
+# .env只在导入时解析一次，页面加载时直接使用缓存的值
+load_dotenv()
+_ENV_API_KEY = os.getenv("OPENAI_API_KEY", "")
+_ENV_MODEL = os.getenv("OPENAI_MODEL", "")
+_ENV_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+
+# 密钥遮蔽时中间最多显示的星号数量
+_MASK = "*" * 16
+
+# 预览渲染的缩放矩阵，模块级常量，避免每页重新构造
+_PREVIEW_MATRIX = fitz.Matrix(1.5, 1.5)
+
+@functools.lru_cache(maxsize=8)
+def _mask_api_key(api_key: str) -> str:
+    n = len(api_key)
+    if n < 8:
+        return api_key
+    return f"{api_key[:4]}{_MASK[:n - 8]}{api_key[-4:]}"
+
 class GradioClient:
     def __init__(self, server_url: str = "http://localhost:8000"):
         self.client = BabelDOCClient(server_url)
@@ -23,11 +43,11 @@ class GradioClient:
         # 获取项目根目录路径
         self.project_root = Path(__file__).parent.parent.parent
         self.sample_file_path = self.project_root / "simaple" / "11.pdf"
-        # 配置缓存
+        # 配置缓存，创建时用环境变量初始化一次，未设置API Key时使用占位符
         self.config_cache = {
-            "openai_api_key": "",
-            "openai_model": "",
-            "openai_base_url": ""
+            "openai_api_key": _ENV_API_KEY or "sk-****",
+            "openai_model": _ENV_MODEL,
+            "openai_base_url": _ENV_BASE_URL
         }
         
     def update_config(self, api_key: str = None, model: str = None, base_url: str = None) -> str:
@@ -42,9 +62,9 @@ class GradioClient:
     
     def get_masked_api_key(self, api_key: str) -> str:
         """获取遮蔽的API密钥"""
-        if not api_key or len(api_key) < 8:
+        if not api_key:
             return api_key
-        return api_key[:4] + "*" * (len(api_key) - 8) + api_key[-4:]
+        return _mask_api_key(api_key)
         
     def check_server_status(self) -> Tuple[str, Dict]:
         """检查服务器状态和配置"""
@@ -54,14 +74,6 @@ class GradioClient:
             
             config = self.client.get_server_config()
             
-            # 更新配置缓存为服务器当前值
-            if not self.config_cache["openai_api_key"]:
-                self.config_cache["openai_api_key"] = "sk-****"  # 默认占位符
-            if not self.config_cache["openai_model"]:
-                self.config_cache["openai_model"] = config['config']['openai_model']
-            if not self.config_cache["openai_base_url"]:
-                self.config_cache["openai_base_url"] = ""  # 服务器不返回base_url
-            
             status_text = f"""✅ 服务器在线
             
 **服务器配置:**
@@ -73,7 +85,7 @@ class GradioClient:
         except Exception as e:
             return f"❌ 连接失败: {str(e)}", {}
     
-    def pdf_to_images(self, pdf_path: str, max_pages: int = None) -> list:
+    def pdf_to_images(self, pdf_path: str, max_pages: int = None, matrix: "fitz.Matrix" = _PREVIEW_MATRIX) -> list:
         """将PDF转换为图片预览"""
         if not pdf_path or not os.path.exists(pdf_path):
             return []
@@ -85,10 +97,9 @@ class GradioClient:
             num_pages = len(doc) if max_pages is None else min(len(doc), max_pages)
             for page_num in range(num_pages):
                 page = doc[page_num]
-                # 设置缩放比例以获得合适的预览大小
-                mat = fitz.Matrix(1.5, 1.5)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
+                pix = page.get_pixmap(matrix=matrix)
+                # 用MuPDF原生编码器直接生成JPEG，文字页面体积远小于PNG
+                img_data = pix.tobytes("jpeg", jpg_quality=80)
                 
                 # 转换为PIL Image
                 img = Image.open(BytesIO(img_data))
@@ -387,6 +398,7 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
                             columns=1,
                             rows=2,
                             height="400px",
+                            format="jpeg",
                             show_download_button=False,
                             interactive=False
                         )
@@ -407,6 +419,7 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
                             columns=1,
                             rows=2,
                             height="400px",
+                            format="jpeg",
                             show_download_button=False,
                             interactive=False
                         )
@@ -587,16 +600,7 @@ def create_gradio_interface(server_url: str = "http://localhost:8000"):
         
         def load_config_from_server():
             """从环境变量和服务器加载配置到输入框"""
-            import os
-            from dotenv import load_dotenv
-            
-            # 加载.env文件
-            load_dotenv()
-            
-            # 从环境变量读取配置
-            api_key = os.getenv("OPENAI_API_KEY", "")
-            model = os.getenv("OPENAI_MODEL", "")
-            base_url = os.getenv("OPENAI_BASE_URL", "")
+            api_key, model, base_url = _ENV_API_KEY, _ENV_MODEL, _ENV_BASE_URL
             
             # 更新配置缓存
             gradio_client.config_cache.update({
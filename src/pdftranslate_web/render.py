@@ -0,0 +1,81 @@
+"""
+PDF预览页面渲染
+
+供Gradio客户端的渲染进程池使用。本模块只依赖标准库和PyMuPDF，spawn子进程导入它时不会加载gradio或BabelDOC。
+"""
+
+import atexit
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Tuple
+
+# 灰度检测用的低分辨率探测缩放比例
+GRAY_PROBE_ZOOM = 0.1
+
+# 同时保持打开的PDF文档数量上限
+DOC_CACHE_SIZE = 8
+
+JPEG_QUALITY = 75
+
+# 已打开文档缓存 {路径: (修改时间, 文档)}，每个进程各自持有一份。
+# MuPDF文档对象不能被多个线程同时使用，在主进程中直接渲染时打开、渲染和关闭都要持有此锁
+_doc_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_lock = threading.RLock()
+
+def _open_doc(pdf_path: str):
+    """复用已打开的文档，避免重复解析xref表；文件被修改后重新打开。调用方需持有_lock"""
+    mtime = os.path.getmtime(pdf_path)
+    entry = _doc_cache.get(pdf_path)
+    if entry and entry[0] == mtime:
+        _doc_cache.move_to_end(pdf_path)
+        return entry[1]
+    if entry:
+        entry[1].close()
+    # PyMuPDF导入较慢，推迟到首次生成预览时再加载
+    import fitz  # PyMuPDF
+    doc = fitz.open(pdf_path)
+    _doc_cache[pdf_path] = (mtime, doc)
+    while len(_doc_cache) > DOC_CACHE_SIZE:
+        _, (_, old) = _doc_cache.popitem(last=False)
+        old.close()
+    return doc
+
+@functools.lru_cache(maxsize=None)
+def _matrix(zoom: float):
+    """按缩放比例缓存fitz.Matrix，渲染每页时不再重复构造"""
+    import fitz  # PyMuPDF
+    return fitz.Matrix(zoom, zoom)
+
+def _is_grayscale(page) -> bool:
+    """以极低分辨率渲染整页，所有像素R==G==B即视为灰度页面"""
+    samples = page.get_pixmap(matrix=_matrix(GRAY_PROBE_ZOOM), alpha=False).samples
+    return samples[0::3] == samples[1::3] == samples[2::3]
+
+@atexit.register
+def _close_docs():
+    """进程退出时关闭缓存中仍然打开的文档，释放MuPDF上下文"""
+    with _lock:
+        while _doc_cache:
+            _, (_, doc) = _doc_cache.popitem()
+            doc.close()
+
+def page_count(pdf_path: str) -> int:
+    with _lock:
+        return len(_open_doc(pdf_path))
+
+def render_page(pdf_path: str, page_num: int, zoom: float, thumb_path: str) -> str:
+    """将单页渲染为JPEG并直接写入缓存文件，返回文件路径"""
+    import fitz  # PyMuPDF
+    with _lock:
+        page = _open_doc(pdf_path).load_page(page_num)
+        # 灰度页面（如大多数扫描件）直接渲染为单通道，像素数据量减少为RGB的1/3
+        colorspace = fitz.csGRAY if _is_grayscale(page) else fitz.csRGB
+        # 设置缩放比例以获得合适的预览大小；预览不需要透明通道
+        pix = page.get_pixmap(matrix=_matrix(zoom), colorspace=colorspace, alpha=False)
+    # 先写临时文件再原子替换，并发渲染或进程中途退出时不会留下半截的缓存文件
+    tmp_path = f"{thumb_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    pix.save(tmp_path, output="jpeg", jpg_quality=JPEG_QUALITY)
+    os.replace(tmp_path, thumb_path)
+    return thumb_path
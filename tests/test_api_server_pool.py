@@ -0,0 +1,88 @@
+# 翻译进程池测试：用桩模块代替BabelDOC，验证工作进程崩溃后后续任务仍能正常执行
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+BABELDOC_STUBS = {
+    "babeldoc/__init__.py": "",
+    "babeldoc/format/__init__.py": "",
+    "babeldoc/format/pdf/__init__.py": "",
+    "babeldoc/format/pdf/high_level.py": """
+        import os
+        from types import SimpleNamespace
+
+        def init():
+            pass
+
+        async def async_translate(config):
+            # 输入文件名包含crash时模拟工作进程被强制终止（如OOM或MuPDF段错误）
+            if "crash" in config.input_file:
+                os._exit(1)
+            yield {"type": "progress_update", "overall_progress": 100.0}
+            yield {"type": "finish", "translate_result": SimpleNamespace(dual_pdf_path=None, mono_pdf_path=None)}
+    """,
+    "babeldoc/format/pdf/translation_config.py": """
+        class WatermarkOutputMode:
+            NoWatermark = "no_watermark"
+            Both = "both"
+            Watermarked = "watermarked"
+
+        class TranslationConfig:
+            def __init__(self, **kwargs):
+                self.__dict__.update(kwargs)
+    """,
+    "babeldoc/docvision/__init__.py": "",
+    "babeldoc/docvision/doclayout.py": """
+        class DocLayoutModel:
+            @classmethod
+            def load_onnx(cls):
+                return cls()
+    """,
+    "babeldoc/translator/__init__.py": "",
+    "babeldoc/translator/translator.py": """
+        class OpenAITranslator:
+            def __init__(self, **kwargs):
+                self.__dict__.update(kwargs)
+
+        def set_translate_rate_limiter(qps):
+            pass
+    """,
+}
+
+@pytest.fixture(scope="module")
+def api_server(tmp_path_factory):
+    stub_root = tmp_path_factory.mktemp("stubs")
+    for rel_path, source in BABELDOC_STUBS.items():
+        path = stub_root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+
+    mp = pytest.MonkeyPatch()
+    mp.setenv("OPENAI_API_KEY", "sk-test")
+    mp.setenv("TRANSLATION_WORKERS", "1")
+    # spawn子进程会继承sys.path，桩模块对工作进程同样可见
+    mp.syspath_prepend(str(stub_root))
+    try:
+        yield importlib.import_module("pdftranslate_web.api_server")
+    finally:
+        sys.modules.pop("pdftranslate_web.api_server", None)
+        mp.undo()
+
+def _run_task(client, filename: str) -> dict:
+    response = client.post("/translate", files={"file": (filename, b"%PDF-1.4\n", "application/pdf")})
+    assert response.status_code == 200
+    # TestClient在请求返回前执行完后台任务
+    return client.get(f"/status/{response.json()['task_id']}").json()
+
+def test_pool_recovers_after_worker_crash(api_server):
+    from fastapi.testclient import TestClient
+
+    with TestClient(api_server.app) as client:
+        crashed = _run_task(client, "crash.pdf")
+        assert crashed["status"] == "failed"
+
+        for _ in range(2):
+            status = _run_task(client, "normal.pdf")
+            assert status["status"] == "completed", status["message"]
@@ -1,3 +1,5 @@
+import os
+
 from pdf2docx import Converter
 
 #pdf_file = 'D:\\工作临时\\2025\\10月\\2025年10月11日\\translated_dual.pdf'
@@ -6,7 +8,11 @@ from pdf2docx import Converter
 pdf_file = '/mnt/f/work/code/github/wwwzhouhui/pdftranslate_web/output/ReStoCNet.pdf'
 docx_file = '/mnt/f/work/code/github/wwwzhouhui/pdftranslate_web/output/ReStoCNet.docx'
 
-# convert pdf to docx
-cv = Converter(pdf_file)
-cv.convert(docx_file)      # all pages by default
-cv.close()
\ No newline at end of file
+if __name__ == "__main__":
+    # 多进程按页并行转换，spawn方式启动子进程时必须放在 __main__ 保护下
+    # Converter不支持with语句，用try/finally保证关闭文档
+    cv = Converter(pdf_file)
+    try:
+        cv.convert(docx_file, multi_processing=True, cpu_count=os.cpu_count())      # all pages by default
+    finally:
+        cv.close()
\ No newline at end of file